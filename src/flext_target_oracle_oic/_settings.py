@@ -27,6 +27,8 @@ class FlextTargetOracleOicSettings(FlextMeltanoSettings):
     class _TargetOracleOic(m.BaseModel):
         """Namespaced Oracle OIC target settings."""
 
+        model_config = m.ConfigDict(frozen=True)
+
         oauth_client_id: Annotated[
             str, m.Field(default="", description="OAuth client identifier")
         ]
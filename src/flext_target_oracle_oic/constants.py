@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from flext_meltano import c
 from flext_oracle_oic import FlextOracleOicConstants, t
 
@@ -24,12 +26,23 @@ class FlextTargetOracleOicConstants(c, FlextOracleOicConstants):
         HEADER_CONTENT_TYPE_JSON: str = "application/json"
         HEADER_ACCEPT: str = "Accept"
         HEADER_AUTHORIZATION: str = "Authorization"
+        EMPTY_PROPERTIES: t.JsonMapping = MappingProxyType({})
+        TOKEN_REQUEST_HEADERS: t.StrMapping = MappingProxyType({
+            HEADER_CONTENT_TYPE: HEADER_CONTENT_TYPE_FORM,
+            HEADER_ACCEPT: HEADER_CONTENT_TYPE_JSON,
+        })
         API_PATH_INTEGRATION: str = "/ic/api/integration/v1"
         DEFAULT_VERSION: str = "01.00.0000"
         DEFAULT_PATTERN: str = "ORCHESTRATION"
         DEFAULT_SCHEDULE_TYPE: str = "ONCE"
         DEFAULT_USE_OAUTH2: bool = True
         DEFAULT_VERIFY_SSL: bool = True
+        TOKEN_REFRESH_SKEW_SECONDS: int = 60
+        REQUIRED_SETTINGS_FIELDS: frozenset[str] = frozenset({
+            "base_url",
+            "oauth_client_id",
+            "oauth_client_secret",
+        })
 
 
 c = FlextTargetOracleOicConstants
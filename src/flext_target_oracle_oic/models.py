@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from types import MappingProxyType
 from typing import Annotated
 
 from flext_meltano import m
@@ -26,10 +25,11 @@ class FlextTargetOracleOicModels(m, FlextOracleOicModels):
             adapter_type: Annotated[
                 t.NonEmptyStr, u.Field(description="Type of adapter used")
             ]
+            # Zero-arg lambda: one-arg factories receive data; proxies can't deepcopy.
             properties: Annotated[
                 t.JsonMapping,
                 u.Field(description="Connection properties and configuration"),
-            ] = u.Field(default_factory=MappingProxyType)
+            ] = u.Field(default_factory=lambda: c.TargetOracleOic.EMPTY_PROPERTIES)
 
         class OICIntegration(m.ArbitraryTypesModel):
             """Integration payload model."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, ClassVar, override
 
 from flext_meltano.services.singer_target import FlextMeltanoTargetAbstractions
@@ -61,12 +62,14 @@ class FlextTargetOracleOic(FlextMeltanoTargetAbstractions):
     default_sink_class: ClassVar[type[FlextTargetOracleOicBaseSink]] = (
         FlextTargetOracleOicBaseSink
     )
-    _sink_classes: ClassVar[Mapping[str, type[FlextTargetOracleOicBaseSink]]] = {
-        c.TargetOracleOic.STREAM_CONNECTIONS: FlextTargetOracleOicConnectionsSink,
-        c.TargetOracleOic.STREAM_INTEGRATIONS: FlextTargetOracleOicIntegrationsSink,
-        c.TargetOracleOic.STREAM_PACKAGES: FlextTargetOracleOicPackagesSink,
-        c.TargetOracleOic.STREAM_LOOKUPS: FlextTargetOracleOicLookupsSink,
-    }
+    _sink_classes: ClassVar[Mapping[str, type[FlextTargetOracleOicBaseSink]]] = (
+        MappingProxyType({
+            c.TargetOracleOic.STREAM_CONNECTIONS: FlextTargetOracleOicConnectionsSink,
+            c.TargetOracleOic.STREAM_INTEGRATIONS: FlextTargetOracleOicIntegrationsSink,
+            c.TargetOracleOic.STREAM_PACKAGES: FlextTargetOracleOicPackagesSink,
+            c.TargetOracleOic.STREAM_LOOKUPS: FlextTargetOracleOicLookupsSink,
+        })
+    )
 
     def fetch_sink_class(self, stream_name: str) -> type[FlextTargetOracleOicBaseSink]:
         """Resolve sink class by stream name."""
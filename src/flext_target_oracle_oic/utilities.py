@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import Mapping
+from functools import cached_property
+from types import MappingProxyType
 
 from flext_api import FlextApi, FlextApiSettings
 from flext_meltano import u
@@ -23,11 +26,11 @@ class FlextTargetOracleOicUtilities(u, FlextOracleOicUtilities):
             @staticmethod
             def validate_config(settings: t.ConfigurationMapping) -> p.Result[bool]:
                 """Validate required OIC target configuration keys."""
-                required = {"base_url", "oauth_client_id", "oauth_client_secret"}
+                required = c.TargetOracleOic.REQUIRED_SETTINGS_FIELDS
+                if settings.keys() >= required:
+                    return r[bool].ok(value=True)
                 missing = sorted(key for key in required if key not in settings)
-                if missing:
-                    return r[bool].fail(f"Missing required settings fields: {missing}")
-                return r[bool].ok(value=True)
+                return r[bool].fail(f"Missing required settings fields: {missing}")
 
         class Factories:
             """Factory helpers for OIC model instances."""
@@ -68,16 +71,29 @@ class FlextTargetOracleOicUtilities(u, FlextOracleOicUtilities):
                 # oauth fields via self.settings (FLEXT settings SSOT).
                 self.settings: FlextTargetOracleOicSettings = settings
                 self._access_token: str | None = None
+                self._token_expires_at: float | None = None
                 self._auth_scheme: str = c.TargetOracleOic.AUTH_SCHEME_BEARER
+                self._auth_headers: t.StrMapping | None = None
 
             @property
             def auth_headers(self) -> t.StrMapping:
                 """The authentication headers block for requests."""
                 token = self.get_access_token()
-                return {"Authorization": f"{self._auth_scheme} {token}"}
+                if self._auth_headers is None:
+                    self._auth_headers = MappingProxyType({
+                        c.TargetOracleOic.HEADER_AUTHORIZATION: (
+                            f"{self._auth_scheme} {token}"
+                        )
+                    })
+                return self._auth_headers
 
             def build_token_request_data(self) -> t.JsonDict:
                 """Build the payload for requesting an OAuth2 token."""
+                return dict(self._token_request_data)
+
+            @cached_property
+            def _token_request_data(self) -> t.JsonDict:
+                """Validated token payload, built once per authenticator."""
                 oic = self.settings.TargetOracleOic
                 payload: t.MutableStrMapping = {
                     "grant_type": "client_credentials",
@@ -92,7 +108,14 @@ class FlextTargetOracleOicUtilities(u, FlextOracleOicUtilities):
 
             def get_access_token(self, *, force_refresh: bool = False) -> str:
                 """Return the current access token, optionally forcing a refresh."""
-                if self._access_token is not None and (not force_refresh):
+                if (
+                    self._access_token is not None
+                    and (not force_refresh)
+                    and (
+                        self._token_expires_at is None
+                        or time.monotonic() < self._token_expires_at
+                    )
+                ):
                     return self._access_token
                 try:
                     response = self._request_access_token()
@@ -111,23 +134,34 @@ class FlextTargetOracleOicUtilities(u, FlextOracleOicUtilities):
                 token_type = payload_raw.get("token_type")
                 if isinstance(token_type, str) and token_type:
                     self._auth_scheme = token_type
+                expires_in = payload_raw.get("expires_in")
+                self._token_expires_at = None
+                if isinstance(expires_in, int | float) and not isinstance(
+                    expires_in, bool
+                ):
+                    skew = min(
+                        c.TargetOracleOic.TOKEN_REFRESH_SKEW_SECONDS, expires_in / 2
+                    )
+                    self._token_expires_at = time.monotonic() + expires_in - skew
                 self._access_token = access_token
+                self._auth_headers = None
                 return access_token
 
-            def _request_access_token(self) -> m.Api.HttpResponse:
-                """Request one OAuth2 access-token response."""
+            @cached_property
+            def _token_api_settings(self) -> FlextApiSettings:
+                """HTTP settings for the token endpoint, validated once."""
                 oic = self.settings.TargetOracleOic
-                api_config = FlextApiSettings.model_validate({
+                return FlextApiSettings.model_validate({
                     "base_url": oic.oauth_token_url,
                     "timeout": oic.timeout,
                 })
-                response_result = FlextApi(settings=api_config).post(
+
+            def _request_access_token(self) -> m.Api.HttpResponse:
+                """Request one OAuth2 access-token response."""
+                response_result = FlextApi(settings=self._token_api_settings).post(
                     "",
                     data=self.build_token_request_data(),
-                    headers={
-                        "Content-Type": "application/x-www-form-urlencoded",
-                        "Accept": "application/json",
-                    },
+                    headers=c.TargetOracleOic.TOKEN_REQUEST_HEADERS,
                 )
                 if response_result.failure:
                     msg = f"Failed to request OAuth2 token: {response_result.error}"
@@ -11,9 +11,10 @@ from typing import ClassVar
 from unittest.mock import Mock, patch
 
 import pytest
+from pydantic import ValidationError
 from singer_sdk.target_base import Target as SingerTarget
 
-from flext_target_oracle_oic import FlextTargetOracleOicSettings, u
+from flext_target_oracle_oic import FlextTargetOracleOicSettings, m, u
 from flext_target_oracle_oic.target import (
     FlextTargetOracleOic,
     FlextTargetOracleOicConnectionsSink,
@@ -95,6 +96,41 @@ class TestsFlextTargetOracleOicTarget:
         tm.that(properties, is_=dict)
         tm.that(properties, has="TargetOracleOic")
 
+    def test_settings_namespace_is_frozen(self) -> None:
+        settings = _build_auth_config()
+        with pytest.raises(ValidationError):
+            settings.TargetOracleOic.timeout = 60
+        tm.that(settings.TargetOracleOic.timeout, eq=30)
+
+    def test_settings_namespace_accepts_env_overrides(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("FLEXT_TARGET_ORACLE_OIC_TargetOracleOic__timeout", "45")
+        monkeypatch.setenv(
+            "FLEXT_TARGET_ORACLE_OIC_TargetOracleOic__oauth_client_id", "env-client"
+        )
+        settings = AuthTestSettings()
+        tm.that(settings.TargetOracleOic.timeout, eq=45)
+        tm.that(settings.TargetOracleOic.oauth_client_id, eq="env-client")
+
+    def test_validate_config_reports_sorted_missing_fields(self) -> None:
+        validation = u.TargetOracleOic.Validation
+        tm.ok(
+            validation.validate_config({
+                "base_url": "https://oic.example.com",
+                "oauth_client_id": "client-id",
+                "oauth_client_secret": "secret",
+            })
+        )
+        result = validation.validate_config({"oauth_client_id": "client-id"})
+        tm.fail(result, has="['base_url', 'oauth_client_secret']")
+
+    def test_oic_connection_defaults_to_empty_properties(self) -> None:
+        connection = m.TargetOracleOic.OICConnection(
+            id="conn-1", name="Connection", adapter_type="rest"
+        )
+        tm.that(dict(connection.properties), eq={})
+
     def test_oic_authenticator_builds_payload(self) -> None:
         authenticator = u.TargetOracleOic.Authenticator(_build_auth_config())
         payload = authenticator.build_token_request_data()
@@ -112,6 +148,90 @@ class TestsFlextTargetOracleOicTarget:
         tm.that(payload, lacks="scope")
         tm.that(payload, lacks="audience")
 
+    def test_oic_authenticator_token_payload_is_not_shared(self) -> None:
+        authenticator = u.TargetOracleOic.Authenticator(_build_auth_config())
+        first = authenticator.build_token_request_data()
+        first["scope"] = "mutated"
+        payload = authenticator.build_token_request_data()
+        tm.that(payload["scope"], eq="urn:opc:resource:consumer:all")
+
+    def test_oic_authenticator_rebuilds_headers_on_token_refresh(self) -> None:
+        authenticator = u.TargetOracleOic.Authenticator(_build_auth_config())
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.body = {"access_token": "token-1", "token_type": "Bearer"}
+
+        with patch(
+            "flext_api.FlextApi.post", return_value=result_type[Mock].ok(mock_response)
+        ):
+            headers = authenticator.auth_headers
+            assert authenticator.auth_headers is headers
+            mock_response.body = {"access_token": "token-2"}
+            authenticator.get_access_token(force_refresh=True)
+            refreshed = authenticator.auth_headers
+
+        tm.that(headers["Authorization"], eq="Bearer token-1")
+        tm.that(refreshed["Authorization"], eq="Bearer token-2")
+
+    def test_oic_authenticator_refreshes_already_expired_token(self) -> None:
+        authenticator = u.TargetOracleOic.Authenticator(_build_auth_config())
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.body = {"access_token": "short-lived", "expires_in": 0}
+
+        with patch(
+            "flext_api.FlextApi.post", return_value=result_type[Mock].ok(mock_response)
+        ):
+            tm.that(authenticator.get_access_token(), eq="short-lived")
+            mock_response.body = {"access_token": "long-lived", "expires_in": 3600}
+            tm.that(authenticator.get_access_token(), eq="long-lived")
+            mock_response.body = {"access_token": "unused", "expires_in": 3600}
+            tm.that(authenticator.get_access_token(), eq="long-lived")
+
+    def test_oic_authenticator_refreshes_inside_skew_window(self) -> None:
+        authenticator = u.TargetOracleOic.Authenticator(_build_auth_config())
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.body = {"access_token": "token-1", "expires_in": 3600}
+        t0 = 1000.0
+
+        with (
+            patch(
+                "flext_api.FlextApi.post",
+                return_value=result_type[Mock].ok(mock_response),
+            ) as post,
+            patch(
+                "flext_target_oracle_oic.utilities.time.monotonic", return_value=t0
+            ) as clock,
+        ):
+            tm.that(authenticator.get_access_token(), eq="token-1")
+            mock_response.body = {"access_token": "token-2", "expires_in": 3600}
+            clock.return_value = t0 + 3539
+            tm.that(authenticator.get_access_token(), eq="token-1")
+            tm.that(post.call_count, eq=1)
+            clock.return_value = t0 + 3541
+            tm.that(authenticator.get_access_token(), eq="token-2")
+
+        tm.that(post.call_count, eq=2)
+
+    def test_oic_authenticator_reuses_token_shorter_than_refresh_skew(self) -> None:
+        authenticator = u.TargetOracleOic.Authenticator(_build_auth_config())
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.body = {"access_token": "short-lived", "expires_in": 30}
+
+        with patch(
+            "flext_api.FlextApi.post", return_value=result_type[Mock].ok(mock_response)
+        ) as post:
+            tm.that(authenticator.get_access_token(), eq="short-lived")
+            tm.that(authenticator.get_access_token(), eq="short-lived")
+
+        tm.that(post.call_count, eq=1)
+
     def test_oic_authenticator_rejects_invalid_token_response(self) -> None:
 
         authenticator = u.TargetOracleOic.Authenticator(_build_auth_config())